@@ -37,9 +37,35 @@ contract Strategy is BaseStrategy, Ownable {
     uint256 public minCompToClaim = 10 ether;
     uint256 public dustThreshold = 1;
     address public tradeFactory;
+    // amount of assets the vault wants out of compound, kept idle once redeemed
+    uint256 public unwindTarget;
+    // maximum amount redeemed from compound in a single unwind
+    uint256 public maxUnwindPerCall = type(uint256).max;
+    // minimum amount worth redeeming in a single unwind
+    uint256 public minUnwindAmount;
+    // can call unwind besides vault and owner
+    address public keeper;
 
     CErc20I public immutable cToken;
 
+    modifier onlyVaultOrOwner() {
+        require(
+            msg.sender == vault || msg.sender == owner(),
+            "not vault or owner"
+        );
+        _;
+    }
+
+    modifier onlyKeepers() {
+        require(
+            msg.sender == keeper ||
+                msg.sender == vault ||
+                msg.sender == owner(),
+            "not keeper"
+        );
+        _;
+    }
+
     constructor(
         address _vault,
         string memory _name,
@@ -52,6 +78,7 @@ contract Strategy is BaseStrategy, Ownable {
             type(uint256).max
         );
         IERC20(COMP).safeApprove(address(UNISWAP_ROUTER), type(uint256).max);
+        minUnwindAmount = 10 ** IVault(vault).decimals();
     }
 
     function _maxWithdraw(
@@ -91,7 +118,10 @@ contract Strategy is BaseStrategy, Ownable {
     }
 
     function _withdraw(uint256 amount) internal override returns (uint256) {
-        return _freeFunds(amount);
+        uint256 amountFreed = _freeFunds(amount);
+        // withdrawn assets count toward the unwind target
+        unwindTarget -= Math.min(unwindTarget, amountFreed);
+        return amountFreed;
     }
 
     function _totalAssets() internal view override returns (uint256) {
@@ -99,9 +129,38 @@ contract Strategy is BaseStrategy, Ownable {
     }
 
     function _invest() internal override {
-        uint256 _availableToInvest = balanceOfAsset();
-        if (_availableToInvest > 0) {
-            _depositToCompound(_availableToInvest);
+        uint256 idleAmount = balanceOfAsset();
+        // keep assets parked for the vault while unwinding
+        if (idleAmount > unwindTarget) {
+            unchecked {
+                _depositToCompound(idleAmount - unwindTarget);
+            }
+        }
+    }
+
+    /**
+     * @notice Amount that can be redeemed from compound towards the unwind target right now
+     * @dev Limited by the remaining target, cash available in cToken and max unwind per call
+     * @return Amount of assets to redeem
+     */
+    function pendingUnwind() public view returns (uint256) {
+        uint256 idleAmount = balanceOfAsset();
+        if (unwindTarget <= idleAmount) {
+            return 0;
+        }
+        uint256 amount;
+        unchecked {
+            amount = unwindTarget - idleAmount;
+        }
+        amount = Math.min(amount, balanceOfCToken());
+        amount = Math.min(amount, IERC20(asset).balanceOf(address(cToken)));
+        return Math.min(amount, maxUnwindPerCall);
+    }
+
+    function _unwind() internal {
+        uint256 amount = pendingUnwind();
+        if (amount >= minUnwindAmount) {
+            _withdrawFromCompound(amount);
         }
     }
 
@@ -226,6 +285,9 @@ contract Strategy is BaseStrategy, Ownable {
             getRewardsPending() + IERC20(COMP).balanceOf(address(this)) >
             minCompToClaim
         ) return true;
+        uint256 unwindAmount = pendingUnwind();
+        if (unwindAmount > dustThreshold && unwindAmount >= minUnwindAmount)
+            return true;
     }
 
     // can be called by either owner or the vault
@@ -236,9 +298,17 @@ contract Strategy is BaseStrategy, Ownable {
             _disposeOfComp();
         }
 
+        _unwind();
         _invest();
     }
 
+    /*
+     * Redeems whatever cash compound has available towards the unwind target
+     */
+    function unwind() external onlyKeepers {
+        _unwind();
+    }
+
     /*
      * External function that Claims the reward tokens due to this contract address
      */
@@ -335,6 +405,43 @@ contract Strategy is BaseStrategy, Ownable {
         dustThreshold = _dustThreshold;
     }
 
+    /**
+     * @notice Set amount of assets to exit from compound
+     * @dev Every tend or unwind redeems available cash up to this amount and keeps it idle
+     * for the vault. While the target is set, assets deposited by the vault are also kept
+     * idle up to the target instead of being invested. Withdrawals reduce the target.
+     * Set to 0 to disable the exit mode.
+     * @param _unwindTarget Amount of assets to unwind from compound
+     */
+    function setUnwindTarget(uint256 _unwindTarget) external onlyVaultOrOwner {
+        unwindTarget = _unwindTarget;
+    }
+
+    /**
+     * @notice Set maximum amount redeemed from compound in a single unwind
+     * @param _maxUnwindPerCall Maximum value to redeem per tend or unwind
+     */
+    function setMaxUnwindPerCall(uint256 _maxUnwindPerCall) external onlyOwner {
+        maxUnwindPerCall = _maxUnwindPerCall;
+    }
+
+    /**
+     * @notice Set minimum amount worth redeeming from compound in a single unwind
+     * @dev Smaller amounts don't trigger tend and are not redeemed to save gas
+     * @param _minUnwindAmount Minimum value to redeem per tend or unwind
+     */
+    function setMinUnwindAmount(uint256 _minUnwindAmount) external onlyOwner {
+        minUnwindAmount = _minUnwindAmount;
+    }
+
+    /**
+     * @notice Set keeper allowed to call unwind
+     * @param _keeper Address of the keeper
+     */
+    function setKeeper(address _keeper) external onlyOwner {
+        keeper = _keeper;
+    }
+
     // ---------------------- YSWAPS FUNCTIONS ----------------------
     function setTradeFactory(address _tradeFactory) external onlyOwner {
         if (tradeFactory != address(0)) {
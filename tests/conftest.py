@@ -1,5 +1,6 @@
 import pytest
-from ape import Contract, accounts, project
+from ape import Contract, accounts, chain, project
+from utils.cache import ViewCache
 from utils.constants import MAX_INT, WEEK, ROLES
 
 # this should be the address of the ERC-20 used by the strategy/vault
@@ -12,6 +13,39 @@ COMPTROLLER_ADDRESS = "0x3d9819210A31b4961b30EF54bE2aeD79B9c9Cd3B"
 PRICE_FEED_ADDRESS = "0x65c816077C29b557BEE980ae3cC2dCE80204A0C5"
 
 
+@pytest.fixture(scope="session")
+def view_cache():
+    cache = ViewCache(chain.provider)
+    yield cache
+    cache.close()
+
+
+VIEW_CACHE_STATS = {}
+
+
+@pytest.fixture(autouse=True)
+def view_cache_stats(request, view_cache):
+    hits, misses, rpc_calls = view_cache.hits, view_cache.misses, view_cache.rpc_calls
+    yield
+    VIEW_CACHE_STATS[request.node.nodeid] = (
+        view_cache.hits - hits,
+        view_cache.misses - misses,
+        view_cache.rpc_calls - rpc_calls,
+    )
+
+
+def pytest_terminal_summary(terminalreporter):
+    if not VIEW_CACHE_STATS:
+        return
+
+    # every hit is a view call that didn't reach the node
+    terminalreporter.section("view cache")
+    for nodeid, (hits, misses, rpc_calls) in VIEW_CACHE_STATS.items():
+        terminalreporter.write_line(
+            f"{nodeid}: {hits} hits, {misses} misses, {rpc_calls} rpc calls"
+        )
+
+
 @pytest.fixture(scope="session")
 def gov(accounts):
     # TODO: can be changed to actual governance
@@ -55,9 +89,9 @@ def amount(asset):
 
 
 @pytest.fixture(scope="session")
-def ctoken():
+def ctoken(view_cache):
     # NOTE: adding default contract type because it's not verified
-    return Contract(CASSET_ADDRESS, project.CErc20I.contract_type)
+    return view_cache.wrap(Contract(CASSET_ADDRESS, project.CErc20I.contract_type))
 
 
 @pytest.fixture(scope="session")
@@ -71,13 +105,13 @@ def ymechs_safe():
 
 
 @pytest.fixture(scope="session")
-def comptroller(project):
-    yield project.ComptrollerI.at(COMPTROLLER_ADDRESS)
+def comptroller(project, view_cache):
+    yield view_cache.wrap(project.ComptrollerI.at(COMPTROLLER_ADDRESS))
 
 
 @pytest.fixture(scope="session")
-def price_feed(project):
-    yield project.UniswapAnchoredViewI.at(PRICE_FEED_ADDRESS)
+def price_feed(project, view_cache):
+    yield view_cache.wrap(project.UniswapAnchoredViewI.at(PRICE_FEED_ADDRESS))
 
 
 @pytest.fixture(scope="session")
@@ -118,12 +152,12 @@ def vault(gov, asset, create_vault):
 
 
 @pytest.fixture
-def create_strategy(project, strategist):
+def create_strategy(project, strategist, view_cache):
     def create_strategy(vault):
         strategy = strategist.deploy(
             project.Strategy, vault.address, "strategy_name", CASSET_ADDRESS
         )
-        return strategy
+        return view_cache.wrap(strategy)
 
     yield create_strategy
 
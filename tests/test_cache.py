@@ -0,0 +1,115 @@
+import pytest
+from ape import Contract, chain
+from utils.constants import REL_ERROR
+
+
+def read_apr_inputs(vault, strategy, ctoken, comptroller, price_feed):
+    # view reads made by test_apr after the strategy gets its debt, in the same order
+    comptroller.compSupplySpeeds(strategy.cToken())
+    price_feed.price("COMP")
+    price_feed.getUnderlyingPrice(strategy.cToken())
+    vault.decimals()
+    ctoken.totalSupply()
+    ctoken.exchangeRateStored()
+    ctoken.supplyRatePerBlock()
+    strategy.aprAfterDebtChange(0)
+    strategy.getRewardAprForSupplyBase(0)
+    strategy.aprAfterDebtChange(-int(1e12))
+    strategy.aprAfterDebtChange(int(1e12))
+
+
+def test_view_cache_hits(ctoken, price_feed, view_cache):
+    view_cache.invalidate()
+    misses = view_cache.misses
+    hits = view_cache.hits
+    rate = ctoken.exchangeRateStored()
+    price = price_feed.price("COMP")
+    assert view_cache.misses == misses + 2
+
+    rpc_calls = view_cache.rpc_calls
+    assert ctoken.exchangeRateStored() == rate
+    assert price_feed.price("COMP") == price
+    assert view_cache.hits == hits + 2
+    assert view_cache.rpc_calls == rpc_calls
+
+
+def test_view_cache_reduces_rpc_calls(
+    project,
+    create_vault_and_strategy,
+    gov,
+    amount,
+    provide_strategy_with_debt,
+    ctoken,
+    comptroller,
+    price_feed,
+    view_cache,
+):
+    vault, strategy = create_vault_and_strategy(gov, amount)
+    provide_strategy_with_debt(gov, strategy, vault, amount)
+
+    raw_contracts = (
+        vault,
+        project.Strategy.at(strategy.address),
+        Contract(ctoken.address, project.CErc20I.contract_type),
+        project.ComptrollerI.at(comptroller.address),
+        project.UniswapAnchoredViewI.at(price_feed.address),
+    )
+    # warm up ape's own caches so both runs start from the same state
+    read_apr_inputs(*raw_contracts)
+
+    rpc_calls = view_cache.rpc_calls
+    read_apr_inputs(*raw_contracts)
+    raw_rpc_calls = view_cache.rpc_calls - rpc_calls
+
+    view_cache.invalidate()
+    hits = view_cache.hits
+    rpc_calls = view_cache.rpc_calls
+    read_apr_inputs(vault, strategy, ctoken, comptroller, price_feed)
+    cached_rpc_calls = view_cache.rpc_calls - rpc_calls
+
+    # strategy.cToken() is the only view read twice in test_apr
+    assert view_cache.hits == hits + 1
+    assert cached_rpc_calls < raw_rpc_calls
+
+
+def test_view_cache_invalidates_on_transaction(
+    create_vault_and_strategy, gov, amount, provide_strategy_with_debt, view_cache
+):
+    vault, strategy = create_vault_and_strategy(gov, amount)
+    assert strategy.totalAssets() == 0
+
+    hits = view_cache.hits
+    assert strategy.totalAssets() == 0
+    assert view_cache.hits == hits + 1
+
+    provide_strategy_with_debt(gov, strategy, vault, amount)
+
+    misses = view_cache.misses
+    assert pytest.approx(amount, REL_ERROR) == strategy.totalAssets()
+    assert view_cache.misses == misses + 1
+
+
+def test_view_cache_invalidates_on_chain_changes(ctoken, view_cache):
+    view_cache.invalidate()
+    ctoken.exchangeRateStored()
+    hits = view_cache.hits
+    ctoken.exchangeRateStored()
+    assert view_cache.hits == hits + 1
+
+    misses = view_cache.misses
+    chain.mine()
+    ctoken.exchangeRateStored()
+    assert view_cache.misses == misses + 1
+
+    snapshot = chain.snapshot()
+    ctoken.exchangeRateStored()
+    chain.mine()
+    ctoken.exchangeRateStored()
+    hits = view_cache.hits
+    ctoken.exchangeRateStored()
+    assert view_cache.hits == hits + 1
+
+    misses = view_cache.misses
+    chain.restore(snapshot)
+    ctoken.exchangeRateStored()
+    assert view_cache.misses == misses + 1
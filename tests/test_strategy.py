@@ -251,6 +251,95 @@ def test_withdraw_low_liquidity(
     assert new_debt - max_withdraw > strategy.balanceOfCToken()
 
 
+def test_unwind_low_liquidity(
+    asset,
+    ctoken,
+    user,
+    create_vault_and_strategy,
+    gov,
+    strategist,
+    amount,
+    provide_strategy_with_debt,
+):
+    vault, strategy = create_vault_and_strategy(gov, amount)
+    new_debt = amount
+    provide_strategy_with_debt(gov, strategy, vault, new_debt)
+
+    # let's drain ctoken contract
+    drained = asset.balanceOf(ctoken) - 10 ** vault.decimals()
+    asset.transfer(user, drained, sender=ctoken)
+
+    strategy.setUnwindTarget(new_debt, sender=vault)
+    assert strategy.unwindTarget() == new_debt
+    assert pytest.approx(10 ** vault.decimals(), REL_ERROR) == strategy.pendingUnwind()
+
+    # available cash is below minimum unwind amount
+    strategy.setMinUnwindAmount(2 * 10 ** vault.decimals(), sender=strategist)
+    assert not strategy.tendTrigger()
+    strategy.tend(sender=vault)
+    assert asset.balanceOf(strategy) == 0
+
+    # only available cash is redeemed and kept idle
+    strategy.setMinUnwindAmount(10 ** vault.decimals(), sender=strategist)
+    strategy.tend(sender=vault)
+    assert pytest.approx(10 ** vault.decimals(), REL_ERROR) == asset.balanceOf(strategy)
+    # no cash left in ctoken
+    assert strategy.pendingUnwind() == 0
+    assert not strategy.tendTrigger()
+
+    # liquidity returns, nothing to unwind without a target
+    asset.transfer(ctoken, drained, sender=user)
+    strategy.setUnwindTarget(0, sender=vault)
+    assert strategy.pendingUnwind() == 0
+    assert not strategy.tendTrigger()
+
+    # unwind is capped per call
+    strategy.setUnwindTarget(new_debt, sender=vault)
+    max_unwind = new_debt // 4
+    strategy.setMaxUnwindPerCall(max_unwind, sender=strategist)
+    assert strategy.pendingUnwind() == max_unwind
+    assert strategy.tendTrigger()
+
+    idle_before = asset.balanceOf(strategy)
+    # keeper can unwind
+    strategy.setKeeper(user, sender=strategist)
+    strategy.unwind(sender=user)
+    assert pytest.approx(idle_before + max_unwind, REL_ERROR) == asset.balanceOf(
+        strategy
+    )
+
+    # idle assets are not reinvested and withdrawals reduce the target
+    strategy.tend(sender=vault)
+    idle = asset.balanceOf(strategy)
+    assert idle >= idle_before + 2 * max_unwind
+    strategy.withdraw(idle, vault, vault, sender=vault)
+    assert strategy.unwindTarget() == new_debt - idle
+    assert asset.balanceOf(strategy) == 0
+
+    # deposits keep idle assets up to the unwind target
+    asset.approve(strategy, idle, sender=vault)
+    strategy.deposit(idle, vault, sender=vault)
+    assert asset.balanceOf(strategy) == strategy.unwindTarget()
+
+
+def test_unwind__reverts(create_vault_and_strategy, gov, amount, user):
+    vault, strategy = create_vault_and_strategy(gov, amount)
+    with reverts("not vault or owner"):
+        strategy.setUnwindTarget(amount, sender=user)
+
+    with reverts("not keeper"):
+        strategy.unwind(sender=user)
+
+    with reverts("Ownable: caller is not the owner"):
+        strategy.setMaxUnwindPerCall(amount, sender=vault)
+
+    with reverts("Ownable: caller is not the owner"):
+        strategy.setMinUnwindAmount(amount, sender=vault)
+
+    with reverts("Ownable: caller is not the owner"):
+        strategy.setKeeper(user, sender=vault)
+
+
 def test_apr(
     asset,
     ctoken,
@@ -0,0 +1,112 @@
+from ape.contracts import ContractInstance
+
+# RPC methods that can change chain state, any of them invalidates cached views
+STATE_CHANGING_PREFIXES = ("eth_send", "evm_", "hardhat_", "anvil_")
+
+
+class ViewCache:
+    """
+    Memoizes contract view results keyed by (contract, method, args).
+    Taps the web3 provider to count RPC calls and to drop cached results
+    whenever a transaction is sent, a block is mined or a snapshot is reverted.
+    The fork automines, so new blocks only come from those requests and the
+    cached results always belong to the current block.
+    """
+
+    def __init__(self, provider):
+        self.hits = 0
+        self.misses = 0
+        self.rpc_calls = 0
+        self._results = {}
+
+        self._web3_provider = provider.web3.provider
+        self._make_request = self._web3_provider.make_request
+        self._web3_provider.make_request = self._tracked_request
+        self._reset_request_func()
+
+    def _reset_request_func(self):
+        # web3 caches the request function built from make_request, force a rebuild
+        if hasattr(self._web3_provider, "_request_func_cache"):
+            self._web3_provider._request_func_cache = (None, None)
+
+    def _tracked_request(self, method, params):
+        self.rpc_calls += 1
+        if method.startswith(STATE_CHANGING_PREFIXES):
+            self.invalidate()
+        return self._make_request(method, params)
+
+    def close(self):
+        """
+        Restores the original web3 provider request function.
+        """
+        self._web3_provider.make_request = self._make_request
+        self._reset_request_func()
+        self.invalidate()
+
+    def invalidate(self):
+        self._results.clear()
+
+    def call(self, address, method, handler, args):
+        key = (address, method, _cache_key(args))
+        if key in self._results:
+            self.hits += 1
+            return self._results[key]
+
+        self.misses += 1
+        result = handler(*args)
+        self._results[key] = result
+        return result
+
+    def wrap(self, contract):
+        return CachedContract(contract, self)
+
+
+class CachedContract(ContractInstance):
+    """
+    Contract instance that serves view calls from a shared ViewCache.
+    Transactions and calls with keyword arguments (e.g. `block_identifier`)
+    are passed through untouched.
+    """
+
+    def __init__(self, contract, cache):
+        self._view_cache = cache
+        self._view_names = {abi.name for abi in contract.contract_type.view_methods}
+        super().__init__(
+            contract.address,
+            contract.contract_type,
+            txn_hash=getattr(contract, "txn_hash", None),
+        )
+
+    def __getattr__(self, attr_name):
+        handler = super().__getattr__(attr_name)
+        if attr_name in self.__dict__.get("_view_names", ()):
+            return CachedCall(self._view_cache, self.address, attr_name, handler)
+        return handler
+
+
+class CachedCall:
+    def __init__(self, cache, address, method, handler):
+        self._cache = cache
+        self._address = address
+        self._method = method
+        self._handler = handler
+
+    def __call__(self, *args, **kwargs):
+        if kwargs:
+            return self._handler(*args, **kwargs)
+        return self._cache.call(self._address, self._method, self._handler, args)
+
+    def __getattr__(self, attr_name):
+        return getattr(self._handler, attr_name)
+
+
+def _cache_key(value):
+    if hasattr(value, "address"):
+        return str(value.address)
+    if isinstance(value, (list, tuple)):
+        return tuple(_cache_key(item) for item in value)
+    if isinstance(value, bytes):
+        return value
+    if isinstance(value, dict):
+        return tuple(sorted((k, _cache_key(v)) for k, v in value.items()))
+    return value